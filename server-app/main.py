@@ -5,22 +5,28 @@ import logging
 import os
 import random
 import re
+import time
 import uuid
-from collections import Counter, deque
-from contextlib import suppress
+from collections import Counter, OrderedDict, deque
+from collections.abc import AsyncIterator, Awaitable, Mapping
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from threading import Lock, Thread
 from typing import Any
 from urllib.parse import quote, urlparse
 
-import psycopg
+import asyncpg
 import httpx
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field, field_validator, model_validator
+from starlette.websockets import WebSocketState
 
 from services.gemini_live import (
     GeminiLiveBusyError,
@@ -53,6 +59,8 @@ REPO_ROOT = SERVER_APP_ROOT.parent
 
 
 def load_archess_env() -> Path | None:
+    if os.getenv("ARCHESS_LOAD_DOTENV", "1").strip() == "0":
+        return None
     for candidate in (SERVER_APP_ROOT / ".env", REPO_ROOT / ".env"):
         if candidate.is_file():
             load_dotenv(candidate, override=False)
@@ -65,9 +73,18 @@ LOADED_ENV_PATH = load_archess_env()
 if LOADED_ENV_PATH is not None:
     logger.info("Loaded backend environment from %s", LOADED_ENV_PATH)
 else:
-    logger.info("No .env file found via explicit backend search; using process environment only.")
+    logger.info("No .env file loaded; using process environment only.")
 
 DEFAULT_POSTGRES_PORT = 5432
+POSTGRES_DSN_TEMPLATE = "postgresql://{user}:{password}@{host}:{port}/{database}"
+POSTGRES_POOL_MIN_SIZE = int(os.getenv("POSTGRES_POOL_MIN_SIZE", "4"))
+POSTGRES_POOL_MAX_SIZE = int(os.getenv("POSTGRES_POOL_MAX_SIZE", "16"))
+POSTGRES_STATEMENT_CACHE_SIZE = 1024
+POSTGRES_PING_TIMEOUT_SECONDS = 3.0
+HEALTH_PING_CACHE_TTL_SECONDS = 2.0
+HEALTH_PING_STALE_SECONDS = 30.0
+POSTGRES_PING_OK_MESSAGE = "Postgres ping successful"
+HEALTH_PING_OK_BODY = orjson.dumps({"ok": True, "messages": ["Server ping successful", POSTGRES_PING_OK_MESSAGE]})
 POSTGRES_REQUIRED_TABLES = ("games", "game_moves", "matches", "tickets")
 POSTGRES_SCHEMA_STATEMENTS: tuple[tuple[str, str, str], ...] = (
     (
@@ -153,8 +170,225 @@ POSTGRES_SCHEMA_STATEMENTS: tuple[tuple[str, str, str], ...] = (
         """,
     ),
 )
+POSTGRES_SCHEMA_SCRIPT = ";\n".join(statement.strip() for _, _, statement in POSTGRES_SCHEMA_STATEMENTS)
+TICKET_ROW_COLUMNS = "id, player_id, status, heartbeat_at, expires_at, match_id, created_at, updated_at"
+SQL_FETCH_TICKET = f"SELECT {TICKET_ROW_COLUMNS} FROM tickets WHERE id = $1"
+SQL_FETCH_PLAYER_TICKET = f"SELECT {TICKET_ROW_COLUMNS} FROM tickets WHERE id = $1 AND player_id = $2"
+# Returns the player's active ticket, creating it if needed. A queued ticket is
+# refreshed (a lapsed one also rejoins the back of the queue); a matched ticket
+# comes back unchanged.
+SQL_UPSERT_PLAYER_TICKET = f"""
+    INSERT INTO tickets (id, player_id, status, heartbeat_at, expires_at)
+    VALUES (gen_random_uuid(), $1, 'queued', NOW(), $2)
+    ON CONFLICT (player_id) WHERE status IN ('queued', 'matched')
+    DO UPDATE SET
+        heartbeat_at = CASE WHEN tickets.status = 'queued' THEN NOW() ELSE tickets.heartbeat_at END,
+        expires_at = CASE WHEN tickets.status = 'queued' THEN EXCLUDED.expires_at ELSE tickets.expires_at END,
+        updated_at = CASE WHEN tickets.status = 'queued' THEN NOW() ELSE tickets.updated_at END,
+        created_at = CASE
+            WHEN tickets.status = 'queued' AND tickets.expires_at < NOW() THEN NOW()
+            ELSE tickets.created_at
+        END
+    RETURNING {TICKET_ROW_COLUMNS}
+"""
+SQL_REFRESH_TICKET_HEARTBEAT = f"""
+    UPDATE tickets
+    SET heartbeat_at = NOW(), expires_at = $1, updated_at = NOW()
+    WHERE id = $2
+    RETURNING {TICKET_ROW_COLUMNS}
+"""
+SQL_EXPIRE_TICKET = f"""
+    UPDATE tickets
+    SET status = 'expired', updated_at = NOW()
+    WHERE id = $1 AND status = 'queued'
+    RETURNING {TICKET_ROW_COLUMNS}
+"""
+SQL_CANCEL_TICKET = f"""
+    UPDATE tickets
+    SET status = 'cancelled', updated_at = NOW()
+    WHERE id = $1
+    RETURNING {TICKET_ROW_COLUMNS}
+"""
+# Pairs the ticket with the oldest waiting peer, creating the game and match.
+# Returns both matched tickets (the earlier one plays white), or no rows when
+# nobody is waiting.
+SQL_PAIR_TICKET = f"""
+    WITH peer AS (
+        SELECT id, player_id, created_at
+        FROM tickets
+        WHERE status = 'queued'
+          AND match_id IS NULL
+          AND expires_at >= NOW()
+          AND player_id <> $1::uuid
+        ORDER BY created_at ASC
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    ),
+    g AS (
+        INSERT INTO games (id)
+        SELECT gen_random_uuid()
+        FROM peer
+        RETURNING id
+    ),
+    m AS (
+        INSERT INTO matches (id, game_id, white_player_id, black_player_id, status)
+        SELECT
+            gen_random_uuid(),
+            g.id,
+            CASE WHEN peer.created_at <= $2::timestamptz THEN peer.player_id ELSE $1::uuid END,
+            CASE WHEN peer.created_at <= $2::timestamptz THEN $1::uuid ELSE peer.player_id END,
+            'active'
+        FROM peer, g
+        RETURNING id, game_id, white_player_id, black_player_id
+    )
+    UPDATE tickets
+    SET status = 'matched', match_id = m.id, updated_at = NOW(), expires_at = $3
+    FROM peer, m
+    WHERE tickets.id IN ($4::uuid, peer.id)
+    RETURNING {", ".join(f"tickets.{column}" for column in TICKET_ROW_COLUMNS.split(", "))},
+        m.game_id,
+        m.white_player_id,
+        m.black_player_id
+"""
+# UTC with a "Z" suffix, matching the API's own JSON.
+SQL_JSON_TIMESTAMP_FORMAT = 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"'
+# The whole game log as a single JSON array value.
+SQL_FETCH_GAME_MOVES_JSON = f"""
+    SELECT COALESCE(
+        json_agg(
+            json_build_object(
+                'game_id', game_id,
+                'ply', ply,
+                'move_uci', move_uci,
+                'created_at', to_char(created_at AT TIME ZONE 'UTC', '{SQL_JSON_TIMESTAMP_FORMAT}')
+            )
+            ORDER BY ply ASC
+        ),
+        '[]'::json
+    )::text
+    FROM game_moves
+    WHERE game_id = $1
+"""
+SQL_FETCH_MATCH_PLAYERS = "SELECT game_id, white_player_id, black_player_id FROM matches WHERE id = $1"
+# Upserts a whole batch of game moves in one statement from parallel arrays.
+SQL_UPSERT_GAME_MOVES = """
+    INSERT INTO game_moves (game_id, ply, move_uci)
+    SELECT $1::uuid, batch.ply, batch.move_uci
+    FROM unnest($2::bigint[], $3::text[]) AS batch (ply, move_uci)
+    ON CONFLICT (game_id, ply)
+    DO UPDATE SET move_uci = EXCLUDED.move_uci
+    RETURNING game_id, ply, move_uci, created_at
+"""
+# The full move log of a match; used to resync clients on a 409.
+SQL_FETCH_MATCH_MOVES = """
+    SELECT $1::uuid AS match_id, game_id, ply, move_uci, player_id, created_at
+    FROM game_moves
+    WHERE game_id = $2 AND ply > $3
+    ORDER BY ply ASC
+"""
+# Match metadata, latest ply and the moves after $2 in one round-trip; when no
+# move is past $2 a single row comes back whose move columns are NULL.
+SQL_FETCH_MATCH_STATE = """
+    WITH m AS (
+        SELECT id, game_id, white_player_id, black_player_id, status
+        FROM matches
+        WHERE id = $1
+    ),
+    last AS (
+        SELECT COALESCE(MAX(ply), 0) AS latest_ply
+        FROM game_moves
+        WHERE game_id = (SELECT game_id FROM m)
+    )
+    SELECT
+        m.id,
+        m.game_id,
+        m.white_player_id,
+        m.black_player_id,
+        m.status,
+        last.latest_ply,
+        gm.ply,
+        gm.move_uci,
+        gm.player_id AS move_player_id,
+        gm.created_at AS move_created_at
+    FROM m
+    CROSS JOIN last
+    LEFT JOIN game_moves gm ON gm.game_id = m.game_id AND gm.ply > $2
+    ORDER BY gm.ply ASC
+"""
+# Inserts the move only if the match is active, the player is on turn and the ply
+# is next; otherwise the inserted_* columns are NULL and the caller derives the
+# conflict from the match columns. No row means no such match. Inserted moves are
+# published on the match's NOTIFY channel.
+SQL_RECORD_MATCH_MOVE = f"""
+    WITH m AS (
+        SELECT id, game_id, white_player_id, black_player_id, status
+        FROM matches
+        WHERE id = $1
+        FOR UPDATE
+    ),
+    last AS (
+        SELECT COALESCE(MAX(ply), 0) AS latest_ply
+        FROM game_moves
+        WHERE game_id = (SELECT game_id FROM m)
+    ),
+    ins AS (
+        INSERT INTO game_moves (game_id, ply, move_uci, player_id)
+        SELECT m.game_id, $2::bigint, $3::text, $4::uuid
+        FROM m, last
+        WHERE m.status = 'active'
+          AND $2::bigint = last.latest_ply + 1
+          AND (
+              ($4::uuid = m.white_player_id AND last.latest_ply % 2 = 0)
+              OR ($4::uuid = m.black_player_id AND last.latest_ply % 2 = 1)
+          )
+        ON CONFLICT (game_id, ply) DO NOTHING
+        RETURNING ply, move_uci, created_at
+    ),
+    touched AS (
+        UPDATE matches
+        SET updated_at = NOW()
+        WHERE id = $1 AND EXISTS (SELECT 1 FROM ins)
+    ),
+    notified AS (
+        SELECT pg_notify(
+            'match:' || $1::text,
+            json_build_object(
+                'type', 'move',
+                'move', json_build_object(
+                    'match_id', $1::uuid,
+                    'game_id', m.game_id,
+                    'ply', ins.ply,
+                    'move_uci', ins.move_uci,
+                    'player_id', $4::uuid,
+                    'created_at', to_char(ins.created_at AT TIME ZONE 'UTC', '{SQL_JSON_TIMESTAMP_FORMAT}')
+                )
+            )::text
+        )
+        FROM m, ins
+    )
+    SELECT
+        m.game_id,
+        m.white_player_id,
+        m.black_player_id,
+        m.status,
+        last.latest_ply,
+        ins.ply AS inserted_ply,
+        ins.move_uci AS inserted_move_uci,
+        ins.created_at AS inserted_created_at
+    FROM m
+    CROSS JOIN last
+    LEFT JOIN ins ON TRUE
+    LEFT JOIN notified ON TRUE
+"""
+SQL_NOTIFY = "SELECT pg_notify($1, $2)"
 TICKET_TTL_SECONDS = int(os.getenv("MATCH_TICKET_TTL_SECONDS", "30"))
-UCI_MOVE_PATTERN = re.compile(r"^[a-h][1-8][a-h][1-8][qrbn]?$", re.IGNORECASE)
+# Match players never change after pairing, so entries are never invalidated.
+MATCH_PLAYERS_CACHE_SIZE = 4096
+_match_players_cache: OrderedDict[uuid.UUID, dict[str, Any]] = OrderedDict()
+TICKET_STREAM_HEARTBEAT_SECONDS = max(1.0, TICKET_TTL_SECONDS / 3)
+TICKET_EXPIRY_SWEEP_SECONDS = max(1.0, TICKET_TTL_SECONDS / 3)
+TICKET_LONG_POLL_MAX_MS = 25_000
+UCI_MOVE_PATTERN = re.compile(r"[a-h][1-8][a-h][1-8][qrbn]?")
 ACTIVE_TICKET_STATUSES = ("queued", "matched")
 PIECE_VOICE_MIN_WORDS = 3
 PIECE_VOICE_MIN_CHARACTERS = 10
@@ -367,11 +601,22 @@ class GameMoveRequest(BaseModel):
     @classmethod
     def validate_uci_move(cls, value: str) -> str:
         move = value.strip().lower()
-        if not UCI_MOVE_PATTERN.match(move):
+        if not UCI_MOVE_PATTERN.fullmatch(move):
             raise ValueError("Move must be valid UCI notation such as e2e4, e1g1, or e7e8q.")
         return move
 
 
+class GameMovesBatchRequest(BaseModel):
+    moves: list[GameMoveRequest] = Field(..., min_length=1, max_length=1024)
+
+    @model_validator(mode="after")
+    def validate_unique_plies(self) -> "GameMovesBatchRequest":
+        plies = [move.ply for move in self.moves]
+        if len(set(plies)) != len(plies):
+            raise ValueError("Each ply may appear only once per batch.")
+        return self
+
+
 class QueueMatchMoveRequest(GameMoveRequest):
     player_id: uuid.UUID
 
@@ -387,6 +632,10 @@ class TicketResponse(BaseModel):
     poll_after_ms: int = 1000
 
 
+class CreateGameResponse(BaseModel):
+    game_id: uuid.UUID
+
+
 class GameMoveRecord(BaseModel):
     game_id: uuid.UUID
     ply: int
@@ -394,6 +643,11 @@ class GameMoveRecord(BaseModel):
     created_at: datetime
 
 
+class GameMovesResponse(BaseModel):
+    game_id: uuid.UUID
+    moves: list[GameMoveRecord]
+
+
 class MatchMoveRecord(BaseModel):
     match_id: uuid.UUID
     game_id: uuid.UUID
@@ -438,7 +692,7 @@ class GeminiHintRequest(BaseModel):
     @classmethod
     def validate_best_move(cls, value: str) -> str:
         move = value.strip().lower()
-        if not UCI_MOVE_PATTERN.match(move):
+        if not UCI_MOVE_PATTERN.fullmatch(move):
             raise ValueError("best_move must use UCI notation such as e2e4.")
         return move
 
@@ -502,7 +756,7 @@ class GeminiLessonFeedbackRequest(BaseModel):
     @classmethod
     def validate_lesson_move(cls, value: str) -> str:
         move = value.strip().lower()
-        if not UCI_MOVE_PATTERN.match(move):
+        if not UCI_MOVE_PATTERN.fullmatch(move):
             raise ValueError("lesson moves must use UCI notation such as e2e4.")
         return move
 
@@ -2845,6 +3099,16 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def trusted_json_response(content: dict[str, Any], status_code: int = 200) -> Response:
+    # Content must be built from our own rows; asyncpg's UUID subclass goes through default=str.
+    return Response(
+        content=orjson.dumps(content, default=str, option=orjson.OPT_UTC_Z),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+@lru_cache(maxsize=256)
 def is_placeholder_value(value: str | None) -> bool:
     if not value:
         return False
@@ -2873,6 +3137,7 @@ def has_postgres_configuration() -> bool:
     )
 
 
+@lru_cache(maxsize=1)
 def get_postgres_dsn() -> str:
     database_url = os.getenv("DATABASE_URL")
     if database_url and not is_placeholder_value(database_url):
@@ -2887,10 +3152,12 @@ def get_postgres_dsn() -> str:
     if all((pg_host, pg_database, pg_user, pg_password)) and not any(
         is_placeholder_value(value) for value in (pg_host, pg_database, pg_user, pg_password)
     ):
-        return normalize_postgres_dsn(
-            "postgresql://"
-            f"{quote(pg_user, safe='')}:{quote(pg_password, safe='')}"
-            f"@{pg_host}:{pg_port}/{quote(pg_database, safe='')}"
+        return POSTGRES_DSN_TEMPLATE.format(
+            user=quote(pg_user, safe=""),
+            password=quote(pg_password, safe=""),
+            host=pg_host,
+            port=pg_port,
+            database=quote(pg_database, safe=""),
         )
 
     raise RuntimeError(
@@ -2899,6 +3166,7 @@ def get_postgres_dsn() -> str:
     )
 
 
+@lru_cache(maxsize=8)
 def redact_postgres_host(dsn: str) -> str:
     with suppress(Exception):
         parsed = urlparse(dsn)
@@ -2915,48 +3183,135 @@ def redact_postgres_database(dsn: str) -> str:
     return "unknown-db"
 
 
-def connect_postgres() -> psycopg.Connection:
-    dsn = get_postgres_dsn()
+def current_postgres_dsn() -> str:
+    return getattr(app.state, "dsn", None) or get_postgres_dsn()
+
+
+async def connect_postgres() -> asyncpg.Connection:
+    dsn = current_postgres_dsn()
     logger.debug(
         "Connecting to Postgres host=%s db=%s",
         redact_postgres_host(dsn),
         redact_postgres_database(dsn),
     )
-    return psycopg.connect(dsn, connect_timeout=5)
+    return await asyncpg.connect(dsn, timeout=5)
+
+
+async def create_postgres_pool(dsn: str) -> asyncpg.Pool:
+    logger.info(
+        "Opening Postgres pool host=%s db=%s min_size=%s max_size=%s",
+        redact_postgres_host(dsn),
+        redact_postgres_database(dsn),
+        POSTGRES_POOL_MIN_SIZE,
+        POSTGRES_POOL_MAX_SIZE,
+    )
+    return await asyncpg.create_pool(
+        dsn,
+        min_size=POSTGRES_POOL_MIN_SIZE,
+        max_size=POSTGRES_POOL_MAX_SIZE,
+        statement_cache_size=POSTGRES_STATEMENT_CACHE_SIZE,
+        timeout=5,
+    )
 
 
-def ping_postgres() -> tuple[bool, str]:
+async def warm_postgres_pool(pool: asyncpg.Pool) -> None:
+    results = await asyncio.gather(
+        *(pool.acquire(timeout=POSTGRES_PING_TIMEOUT_SECONDS) for _ in range(POSTGRES_POOL_MIN_SIZE)),
+        return_exceptions=True,
+    )
+    connections = [result for result in results if not isinstance(result, BaseException)]
     try:
-        with connect_postgres() as connection:
-            with connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
-                cursor.fetchone()
-        return True, "Postgres ping successful"
+        warmups = await asyncio.gather(
+            *(connection.fetchval("SELECT 1", timeout=POSTGRES_PING_TIMEOUT_SECONDS) for connection in connections),
+            return_exceptions=True,
+        )
+    finally:
+        await asyncio.gather(*(pool.release(connection) for connection in connections))
+
+    failures = [result for result in (*results, *warmups) if isinstance(result, BaseException)]
+    if failures:
+        logger.warning("Postgres pool warm-up incomplete: %s", failures[0])
+
+
+@asynccontextmanager
+async def postgres_connection() -> AsyncIterator[asyncpg.Connection]:
+    pool: asyncpg.Pool | None = getattr(app.state, "pool", None)
+    if pool is not None:
+        async with pool.acquire() as connection:
+            yield connection
+        return
+
+    # One-shot commands such as `--ensure-schema` run without the app pool.
+    connection = await connect_postgres()
+    try:
+        yield connection
+    finally:
+        await connection.close()
+
+
+async def run_postgres_ping() -> None:
+    async with postgres_connection() as connection:
+        await connection.fetchval("SELECT 1")
+
+
+async def ping_postgres() -> tuple[bool, str]:
+    try:
+        await asyncio.wait_for(run_postgres_ping(), timeout=POSTGRES_PING_TIMEOUT_SECONDS)
+        return True, POSTGRES_PING_OK_MESSAGE
+    except TimeoutError:
+        logger.warning("Postgres ping timed out after %ss", POSTGRES_PING_TIMEOUT_SECONDS)
+        return False, f"Postgres ping timed out after {POSTGRES_PING_TIMEOUT_SECONDS:g}s"
     except Exception as exc:  # pragma: no cover - covered indirectly via routes
         logger.exception("Postgres ping failed")
         return False, f"Postgres ping failed: {exc}"
 
 
-def ensure_schema_ready(
-    connection: psycopg.Connection | None = None,
+_health_ping_lock = asyncio.Lock()
+_health_ping_cache: tuple[float, tuple[bool, str]] | None = None
+_health_ping_last_ok: tuple[float, tuple[bool, str]] | None = None
+
+
+async def cached_ping_postgres() -> tuple[bool, str]:
+    global _health_ping_cache, _health_ping_last_ok
+
+    cached = _health_ping_cache
+    if cached is not None and time.monotonic() - cached[0] < HEALTH_PING_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    async with _health_ping_lock:
+        cached = _health_ping_cache
+        if cached is not None and time.monotonic() - cached[0] < HEALTH_PING_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        result = await ping_postgres()
+        checked_at = time.monotonic()
+        if result[0]:
+            _health_ping_last_ok = (checked_at, result)
+        elif _health_ping_last_ok is not None and checked_at - _health_ping_last_ok[0] < HEALTH_PING_STALE_SECONDS:
+            result = _health_ping_last_ok[1]
+        _health_ping_cache = (checked_at, result)
+        return result
+
+
+async def ensure_schema_ready(
+    connection: asyncpg.Connection | None = None,
     *,
     log_details: bool = False,
 ) -> list[str]:
     if connection is None:
-        with connect_postgres() as owned_connection, owned_connection.transaction():
-            return ensure_schema_ready(owned_connection, log_details=log_details)
+        async with postgres_connection() as owned_connection, owned_connection.transaction():
+            return await ensure_schema_ready(owned_connection, log_details=log_details)
 
+    await connection.execute(POSTGRES_SCHEMA_SCRIPT)
     ensured_objects: list[str] = []
-    with connection.cursor() as cursor:
-        for object_type, object_name, statement in POSTGRES_SCHEMA_STATEMENTS:
-            cursor.execute(statement)
-            ensured_objects.append(object_name)
-            if log_details:
-                logger.info("Ensured Postgres %s %s", object_type, object_name)
+    for object_type, object_name, _statement in POSTGRES_SCHEMA_STATEMENTS:
+        ensured_objects.append(object_name)
+        if log_details:
+            logger.info("Ensured Postgres %s %s", object_type, object_name)
     return ensured_objects
 
 
-def ensure_postgres_startup_ready(*, require_configuration: bool = False) -> list[str]:
+async def ensure_postgres_startup_ready(*, require_configuration: bool = False) -> list[str]:
     if not has_postgres_configuration():
         message = (
             "Postgres startup sync skipped because DATABASE_URL or PG* variables are not configured."
@@ -2966,21 +3321,19 @@ def ensure_postgres_startup_ready(*, require_configuration: bool = False) -> lis
         logger.warning(message)
         return []
 
-    dsn = get_postgres_dsn()
+    dsn = current_postgres_dsn()
     host = redact_postgres_host(dsn)
     database = redact_postgres_database(dsn)
     logger.info("Postgres startup connection beginning host=%s db=%s", host, database)
 
-    with connect_postgres() as connection, connection.transaction():
-        with connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
-            cursor.execute("SELECT current_database() AS database_name")
-            row = cursor.fetchone() or {}
+    async with postgres_connection() as connection, connection.transaction():
+        database_name = await connection.fetchval("SELECT current_database()")
         logger.info(
             "Postgres connection succeeded host=%s db=%s",
             host,
-            row.get("database_name", database),
+            database_name or database,
         )
-        ensured_objects = ensure_schema_ready(connection, log_details=True)
+        ensured_objects = await ensure_schema_ready(connection, log_details=True)
 
     logger.info(
         "Postgres schema sync succeeded tables=%s objects=%s",
@@ -2990,76 +3343,95 @@ def ensure_postgres_startup_ready(*, require_configuration: bool = False) -> lis
     return ensured_objects
 
 
-def create_game_record(connection: psycopg.Connection | None = None) -> uuid.UUID:
-    game_id = uuid.uuid4()
-    if connection is None:
-        with connect_postgres() as owned_connection, owned_connection.transaction():
-            ensure_schema_ready(owned_connection)
-            with owned_connection.cursor() as cursor:
-                cursor.execute("INSERT INTO games (id) VALUES (%s)", (game_id,))
-        return game_id
-
-    with connection.cursor() as cursor:
-        cursor.execute("INSERT INTO games (id) VALUES (%s)", (game_id,))
-    return game_id
-
-
-def save_game_move(game_id: uuid.UUID, ply: int, move_uci: str) -> dict[str, Any]:
-    with connect_postgres() as connection, connection.transaction():
-        ensure_schema_ready(connection)
-        with connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
-            cursor.execute(
-                """
-                INSERT INTO game_moves (game_id, ply, move_uci)
-                VALUES (%s, %s, %s)
-                ON CONFLICT (game_id, ply)
-                DO UPDATE SET move_uci = EXCLUDED.move_uci
-                RETURNING game_id, ply, move_uci, created_at
-                """,
-                (game_id, ply, move_uci),
-            )
-            record = cursor.fetchone()
-            if record is None:
-                raise HTTPException(status_code=500, detail="Could not store game move.")
-    return record
-
-
-def fetch_game_moves(game_id: uuid.UUID) -> list[dict[str, Any]]:
-    with connect_postgres() as connection, connection.transaction():
-        ensure_schema_ready(connection)
-        with connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
-            cursor.execute(
-                """
-                SELECT game_id, ply, move_uci, created_at
-                FROM game_moves
-                WHERE game_id = %s
-                ORDER BY ply ASC
-                """,
-                (game_id,),
-            )
-            return list(cursor.fetchall())
+async def create_game_record() -> uuid.UUID:
+    async with postgres_connection() as connection:
+        return await connection.fetchval("INSERT INTO games (id) VALUES (gen_random_uuid()) RETURNING id")
 
 
-def expire_stale_tickets(connection: psycopg.Connection) -> None:
-    with connection.cursor() as cursor:
-        cursor.execute(
-            """
-            UPDATE tickets
-            SET status = 'expired', updated_at = NOW()
-            WHERE status = 'queued' AND expires_at < NOW()
+async def save_game_move(game_id: uuid.UUID, ply: int, move_uci: str) -> dict[str, Any]:
+    async with postgres_connection() as connection, connection.transaction():
+        record = await connection.fetchrow(
             """
+            INSERT INTO game_moves (game_id, ply, move_uci)
+            VALUES ($1, $2, $3)
+            ON CONFLICT (game_id, ply)
+            DO UPDATE SET move_uci = EXCLUDED.move_uci
+            RETURNING game_id, ply, move_uci, created_at
+            """,
+            game_id,
+            ply,
+            move_uci,
         )
+        if record is None:
+            raise HTTPException(status_code=500, detail="Could not store game move.")
+    return dict(record)
+
+
+async def save_game_moves(game_id: uuid.UUID, moves: list[GameMoveRequest]) -> list[dict[str, Any]]:
+    async with postgres_connection() as connection:
+        records = await connection.fetch(
+            SQL_UPSERT_GAME_MOVES,
+            game_id,
+            [move.ply for move in moves],
+            [move.move_uci for move in moves],
+        )
+    return sorted((dict(record) for record in records), key=lambda record: record["ply"])
+
+
+async def fetch_game_moves(game_id: uuid.UUID) -> str:
+    async with postgres_connection() as connection:
+        return await connection.fetchval(SQL_FETCH_GAME_MOVES_JSON, game_id)
+
+
+async def expire_stale_tickets(connection: asyncpg.Connection) -> None:
+    await connection.execute(
+        """
+        UPDATE tickets
+        SET status = 'expired', updated_at = NOW()
+        WHERE status = 'queued' AND expires_at < NOW()
+        """
+    )
+
+
+async def expire_stale_tickets_periodically() -> None:
+    while True:
+        await asyncio.sleep(TICKET_EXPIRY_SWEEP_SECONDS)
+        try:
+            async with postgres_connection() as connection:
+                await expire_stale_tickets(connection)
+        except Exception:
+            logger.exception("Expiring stale matchmaking tickets failed")
+
+
+def match_notification_channel(match_id: uuid.UUID) -> str:
+    return f"match:{match_id}"
+
+
+def ticket_notification_channel(ticket_id: uuid.UUID) -> str:
+    return f"match:ticket:{ticket_id}"
+
+
+def encode_stream_message(message_type: str, payload: dict[str, Any]) -> str:
+    return orjson.dumps(
+        {"type": message_type, message_type: payload},
+        default=str,
+        option=orjson.OPT_UTC_Z,
+    ).decode()
 
 
 def ticket_expiry_from_now() -> datetime:
     return utcnow() + timedelta(seconds=TICKET_TTL_SECONDS)
 
 
+def ticket_has_lapsed(ticket_row: Mapping[str, Any]) -> bool:
+    return ticket_row["status"] == "queued" and ticket_row["expires_at"] < utcnow()
+
+
 def next_turn_for_ply(latest_ply: int) -> str:
     return "white" if latest_ply % 2 == 0 else "black"
 
 
-def color_for_player(match_row: dict[str, Any], player_id: uuid.UUID) -> str | None:
+def color_for_player(match_row: Mapping[str, Any], player_id: uuid.UUID) -> str | None:
     if player_id == match_row["white_player_id"]:
         return "white"
     if player_id == match_row["black_player_id"]:
@@ -3067,97 +3439,72 @@ def color_for_player(match_row: dict[str, Any], player_id: uuid.UUID) -> str | N
     return None
 
 
-def fetch_ticket_row(
-    connection: psycopg.Connection,
+async def fetch_ticket_row(
+    connection: asyncpg.Connection,
     ticket_id: uuid.UUID,
     player_id: uuid.UUID | None = None,
     for_update: bool = False,
 ) -> dict[str, Any] | None:
-    query = """
-        SELECT id, player_id, status, heartbeat_at, expires_at, match_id, created_at, updated_at
-        FROM tickets
-        WHERE id = %s
-    """
+    query = SQL_FETCH_TICKET
     params: list[Any] = [ticket_id]
     if player_id is not None:
-        query += " AND player_id = %s"
+        query = SQL_FETCH_PLAYER_TICKET
         params.append(player_id)
     if for_update:
         query += " FOR UPDATE"
 
-    with connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
-        cursor.execute(query, params)
-        return cursor.fetchone()
+    row = await connection.fetchrow(query, *params)
+    return dict(row) if row is not None else None
+
+
+def remember_match_players(match_id: uuid.UUID, match_players: dict[str, Any]) -> None:
+    _match_players_cache[match_id] = match_players
+    _match_players_cache.move_to_end(match_id)
+    while len(_match_players_cache) > MATCH_PLAYERS_CACHE_SIZE:
+        _match_players_cache.popitem(last=False)
 
 
-def fetch_match_row(
-    connection: psycopg.Connection,
+async def fetch_match_players(
+    connection: asyncpg.Connection,
     match_id: uuid.UUID,
-    for_update: bool = False,
 ) -> dict[str, Any] | None:
-    query = """
-        SELECT id, game_id, white_player_id, black_player_id, status, created_at, updated_at
-        FROM matches
-        WHERE id = %s
-    """
-    if for_update:
-        query += " FOR UPDATE"
-    with connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
-        cursor.execute(query, (match_id,))
-        return cursor.fetchone()
+    cached = _match_players_cache.get(match_id)
+    if cached is not None:
+        _match_players_cache.move_to_end(match_id)
+        return cached
 
+    row = await connection.fetchrow(SQL_FETCH_MATCH_PLAYERS, match_id)
+    if row is None:
+        return None
+    match_players = dict(row)
+    remember_match_players(match_id, match_players)
+    return match_players
 
-def fetch_match_moves(
-    connection: psycopg.Connection,
-    game_id: uuid.UUID,
-    after_ply: int = 0,
-) -> list[dict[str, Any]]:
-    with connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
-        cursor.execute(
-            """
-            SELECT %s::uuid AS match_id, game_id, ply, move_uci, player_id, created_at
-            FROM game_moves
-            WHERE game_id = %s AND ply > %s
-            ORDER BY ply ASC
-            """,
-            (uuid.UUID(int=0), game_id, after_ply),
-        )
-        rows = list(cursor.fetchall())
-    return rows
 
-
-def fetch_match_moves_for_match(
-    connection: psycopg.Connection,
+async def fetch_match_moves(
+    connection: asyncpg.Connection,
     match_id: uuid.UUID,
     game_id: uuid.UUID,
     after_ply: int = 0,
 ) -> list[dict[str, Any]]:
-    with connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
-        cursor.execute(
-            """
-            SELECT %s::uuid AS match_id, game_id, ply, move_uci, player_id, created_at
-            FROM game_moves
-            WHERE game_id = %s AND ply > %s
-            ORDER BY ply ASC
-            """,
-            (match_id, game_id, after_ply),
-        )
-        return list(cursor.fetchall())
+    rows = await connection.fetch(
+        SQL_FETCH_MATCH_MOVES,
+        match_id,
+        game_id,
+        after_ply,
+    )
+    return [dict(row) for row in rows]
 
 
-def current_match_state(
-    connection: psycopg.Connection,
+def build_match_state(
     match_id: uuid.UUID,
-    player_id: uuid.UUID | None = None,
+    match_row: Mapping[str, Any],
+    player_id: uuid.UUID | None,
+    latest_ply: int,
+    moves: list[dict[str, Any]],
 ) -> dict[str, Any]:
-    match_row = fetch_match_row(connection, match_id=match_id)
-    if match_row is None:
-        raise HTTPException(status_code=404, detail="Match not found.")
-
-    moves = fetch_match_moves_for_match(connection, match_id, match_row["game_id"], after_ply=0)
-    latest_ply = moves[-1]["ply"] if moves else 0
     return {
-        "match_id": match_row["id"],
+        "match_id": match_id,
         "game_id": match_row["game_id"],
         "status": match_row["status"],
         "white_player_id": match_row["white_player_id"],
@@ -3169,16 +3516,45 @@ def current_match_state(
     }
 
 
-def ticket_response_for_row(
-    connection: psycopg.Connection,
+async def current_match_state(
+    connection: asyncpg.Connection,
+    match_id: uuid.UUID,
+    player_id: uuid.UUID | None = None,
+    after_ply: int = 0,
+) -> dict[str, Any]:
+    rows = await connection.fetch(SQL_FETCH_MATCH_STATE, match_id, after_ply)
+    if not rows:
+        raise HTTPException(status_code=404, detail="Match not found.")
+
+    match_row = rows[0]
+    moves = [
+        {
+            "match_id": match_row["id"],
+            "game_id": match_row["game_id"],
+            "ply": row["ply"],
+            "move_uci": row["move_uci"],
+            "player_id": row["move_player_id"],
+            "created_at": row["move_created_at"],
+        }
+        for row in rows
+        if row["ply"] is not None
+    ]
+    return build_match_state(match_row["id"], match_row, player_id, match_row["latest_ply"], moves)
+
+
+async def ticket_response_for_row(
+    connection: asyncpg.Connection,
     ticket_row: dict[str, Any],
 ) -> dict[str, Any]:
     assigned_color = None
     if ticket_row["match_id"] is not None:
-        match_row = fetch_match_row(connection, ticket_row["match_id"])
-        if match_row is not None:
-            assigned_color = color_for_player(match_row, ticket_row["player_id"])
+        match_players = await fetch_match_players(connection, ticket_row["match_id"])
+        if match_players is not None:
+            assigned_color = color_for_player(match_players, ticket_row["player_id"])
+    return build_ticket_response(ticket_row, assigned_color)
 
+
+def build_ticket_response(ticket_row: dict[str, Any], assigned_color: str | None) -> dict[str, Any]:
     return {
         "ticket_id": ticket_row["id"],
         "player_id": ticket_row["player_id"],
@@ -3191,316 +3567,360 @@ def ticket_response_for_row(
     }
 
 
-def ensure_player_ticket(
-    connection: psycopg.Connection,
+async def ensure_player_ticket(
+    connection: asyncpg.Connection,
     player_id: uuid.UUID,
 ) -> dict[str, Any]:
-    with connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
-        cursor.execute(
-            """
-            SELECT id, player_id, status, heartbeat_at, expires_at, match_id, created_at, updated_at
-            FROM tickets
-            WHERE player_id = %s AND status IN ('queued', 'matched')
-            ORDER BY created_at DESC
-            LIMIT 1
-            FOR UPDATE
-            """,
-            (player_id,),
-        )
-        ticket_row = cursor.fetchone()
-
-        if ticket_row is not None:
-            if ticket_row["status"] == "queued":
-                expires_at = ticket_expiry_from_now()
-                cursor.execute(
-                    """
-                    UPDATE tickets
-                    SET heartbeat_at = NOW(), expires_at = %s, updated_at = NOW()
-                    WHERE id = %s
-                    RETURNING id, player_id, status, heartbeat_at, expires_at, match_id, created_at, updated_at
-                    """,
-                    (expires_at, ticket_row["id"]),
-                )
-                ticket_row = cursor.fetchone()
-            return ticket_row
-
-        ticket_id = uuid.uuid4()
-        expires_at = ticket_expiry_from_now()
-        cursor.execute(
-            """
-            INSERT INTO tickets (id, player_id, status, heartbeat_at, expires_at)
-            VALUES (%s, %s, 'queued', NOW(), %s)
-            ON CONFLICT DO NOTHING
-            RETURNING id, player_id, status, heartbeat_at, expires_at, match_id, created_at, updated_at
-            """,
-            (ticket_id, player_id, expires_at),
-        )
-        inserted_row = cursor.fetchone()
-        if inserted_row is not None:
-            return inserted_row
-
-        cursor.execute(
-            """
-            SELECT id, player_id, status, heartbeat_at, expires_at, match_id, created_at, updated_at
-            FROM tickets
-            WHERE player_id = %s AND status IN ('queued', 'matched')
-            ORDER BY created_at DESC
-            LIMIT 1
-            FOR UPDATE
-            """,
-            (player_id,),
-        )
-        existing_row = cursor.fetchone()
-        if existing_row is None:
-            raise HTTPException(status_code=409, detail="Could not establish a matchmaking ticket.")
-        return existing_row
+    ticket_row = await connection.fetchrow(SQL_UPSERT_PLAYER_TICKET, player_id, ticket_expiry_from_now())
+    return dict(ticket_row)
 
 
-def try_pair_ticket(
-    connection: psycopg.Connection,
+async def try_pair_ticket(
+    connection: asyncpg.Connection,
     ticket_row: dict[str, Any],
 ) -> dict[str, Any]:
     if ticket_row["status"] != "queued":
         return ticket_row
 
-    with connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
-        cursor.execute(
-            """
-            SELECT id, player_id, status, heartbeat_at, expires_at, match_id, created_at, updated_at
-            FROM tickets
-            WHERE status = 'queued'
-              AND match_id IS NULL
-              AND expires_at >= NOW()
-              AND player_id <> %s
-            ORDER BY created_at ASC
-            LIMIT 1
-            FOR UPDATE SKIP LOCKED
-            """,
-            (ticket_row["player_id"],),
-        )
-        other_ticket = cursor.fetchone()
-
-        if other_ticket is None:
-            return ticket_row
-
-        if other_ticket["player_id"] == ticket_row["player_id"]:
-            return ticket_row
-
-        current_created_at = ticket_row["created_at"]
-        other_created_at = other_ticket["created_at"]
-        white_player_id = other_ticket["player_id"] if other_created_at <= current_created_at else ticket_row["player_id"]
-        black_player_id = ticket_row["player_id"] if white_player_id == other_ticket["player_id"] else other_ticket["player_id"]
+    matched_rows = await connection.fetch(
+        SQL_PAIR_TICKET,
+        ticket_row["player_id"],
+        ticket_row["created_at"],
+        ticket_expiry_from_now(),
+        ticket_row["id"],
+    )
+    if not matched_rows:
+        return ticket_row
 
-        match_id = uuid.uuid4()
-        game_id = create_game_record(connection=connection)
-        cursor.execute(
-            """
-            INSERT INTO matches (id, game_id, white_player_id, black_player_id, status)
-            VALUES (%s, %s, %s, %s, 'active')
-            """,
-            (match_id, game_id, white_player_id, black_player_id),
-        )
-        cursor.execute(
-            """
-            UPDATE tickets
-            SET status = 'matched', match_id = %s, updated_at = NOW(), expires_at = %s
-            WHERE id IN (%s, %s)
-            """,
-            (match_id, ticket_expiry_from_now(), ticket_row["id"], other_ticket["id"]),
-        )
+    first_row = matched_rows[0]
+    remember_match_players(
+        first_row["match_id"],
+        {
+            "game_id": first_row["game_id"],
+            "white_player_id": first_row["white_player_id"],
+            "black_player_id": first_row["black_player_id"],
+        },
+    )
+    await connection.executemany(
+        SQL_NOTIFY,
+        [
+            (
+                ticket_notification_channel(row["id"]),
+                encode_stream_message(
+                    "ticket",
+                    build_ticket_response(dict(row), color_for_player(row, row["player_id"])),
+                ),
+            )
+            for row in matched_rows
+        ],
+    )
 
-    refreshed_ticket = fetch_ticket_row(connection, ticket_row["id"], for_update=False)
+    refreshed_ticket = next((row for row in matched_rows if row["id"] == ticket_row["id"]), None)
     if refreshed_ticket is None:
         raise HTTPException(status_code=500, detail="Could not refresh matched ticket.")
-    return refreshed_ticket
+    return dict(refreshed_ticket)
 
 
-def enqueue_player_for_matchmaking(player_id: uuid.UUID) -> dict[str, Any]:
-    with connect_postgres() as connection, connection.transaction():
-        ensure_schema_ready(connection)
-        expire_stale_tickets(connection)
-        ticket_row = ensure_player_ticket(connection, player_id)
-        ticket_row = try_pair_ticket(connection, ticket_row)
-        return ticket_response_for_row(connection, ticket_row)
+async def enqueue_player_for_matchmaking(player_id: uuid.UUID) -> dict[str, Any]:
+    async with postgres_connection() as connection, connection.transaction():
+        ticket_row = await ensure_player_ticket(connection, player_id)
+        ticket_row = await try_pair_ticket(connection, ticket_row)
+        return await ticket_response_for_row(connection, ticket_row)
 
 
-def heartbeat_matchmaking_ticket(ticket_id: uuid.UUID, player_id: uuid.UUID) -> dict[str, Any]:
-    with connect_postgres() as connection, connection.transaction():
-        ensure_schema_ready(connection)
-        expire_stale_tickets(connection)
-        ticket_row = fetch_ticket_row(connection, ticket_id=ticket_id, player_id=player_id, for_update=True)
+async def heartbeat_matchmaking_ticket(ticket_id: uuid.UUID, player_id: uuid.UUID) -> dict[str, Any]:
+    async with postgres_connection() as connection, connection.transaction():
+        ticket_row = await fetch_ticket_row(connection, ticket_id=ticket_id, player_id=player_id, for_update=True)
         if ticket_row is None:
             raise HTTPException(status_code=404, detail="Ticket not found.")
+        if ticket_has_lapsed(ticket_row):
+            ticket_row = dict(await connection.fetchrow(SQL_EXPIRE_TICKET, ticket_id))
         if ticket_row["status"] in {"cancelled", "expired"}:
-            return ticket_response_for_row(connection, ticket_row)
-
-        expires_at = ticket_expiry_from_now()
-        with connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
-            cursor.execute(
-                """
-                UPDATE tickets
-                SET heartbeat_at = NOW(), expires_at = %s, updated_at = NOW()
-                WHERE id = %s
-                RETURNING id, player_id, status, heartbeat_at, expires_at, match_id, created_at, updated_at
-                """,
-                (expires_at, ticket_id),
-            )
-            ticket_row = cursor.fetchone()
-        ticket_row = try_pair_ticket(connection, ticket_row)
-        return ticket_response_for_row(connection, ticket_row)
+            return await ticket_response_for_row(connection, ticket_row)
+
+        refreshed_row = await connection.fetchrow(
+            SQL_REFRESH_TICKET_HEARTBEAT,
+            ticket_expiry_from_now(),
+            ticket_id,
+        )
+        ticket_row = await try_pair_ticket(connection, dict(refreshed_row))
+        return await ticket_response_for_row(connection, ticket_row)
 
 
-def get_matchmaking_ticket(ticket_id: uuid.UUID, player_id: uuid.UUID | None = None) -> dict[str, Any]:
-    with connect_postgres() as connection, connection.transaction():
-        ensure_schema_ready(connection)
-        expire_stale_tickets(connection)
-        ticket_row = fetch_ticket_row(connection, ticket_id=ticket_id, player_id=player_id, for_update=False)
+async def get_matchmaking_ticket(ticket_id: uuid.UUID, player_id: uuid.UUID | None = None) -> dict[str, Any]:
+    async with postgres_connection() as connection:
+        ticket_row = await fetch_ticket_row(connection, ticket_id=ticket_id, player_id=player_id, for_update=False)
         if ticket_row is None:
             raise HTTPException(status_code=404, detail="Ticket not found.")
-        return ticket_response_for_row(connection, ticket_row)
+        if ticket_has_lapsed(ticket_row):
+            ticket_row = {**ticket_row, "status": "expired"}
+        return await ticket_response_for_row(connection, ticket_row)
 
 
-def cancel_matchmaking_ticket(ticket_id: uuid.UUID, player_id: uuid.UUID) -> dict[str, Any]:
-    with connect_postgres() as connection, connection.transaction():
-        ensure_schema_ready(connection)
-        ticket_row = fetch_ticket_row(connection, ticket_id=ticket_id, player_id=player_id, for_update=True)
+async def wait_for_matchmaking_ticket(
+    ticket_id: uuid.UUID,
+    player_id: uuid.UUID | None,
+    timeout: float,
+) -> dict[str, Any]:
+    channel = ticket_notification_channel(ticket_id)
+    try:
+        queue = await POSTGRES_NOTIFICATIONS.subscribe(channel)
+    except Exception:
+        logger.exception("Could not subscribe to matchmaking notifications")
+        return await get_matchmaking_ticket(ticket_id, player_id)
+
+    try:
+        # Subscribe before reading so a pairing in between still wakes this request.
+        ticket = await get_matchmaking_ticket(ticket_id, player_id)
+        if ticket["status"] != "queued":
+            return ticket
+        with suppress(TimeoutError):
+            await asyncio.wait_for(queue.get(), timeout=timeout)
+        return await get_matchmaking_ticket(ticket_id, player_id)
+    finally:
+        await POSTGRES_NOTIFICATIONS.unsubscribe(channel, queue)
+
+
+async def cancel_matchmaking_ticket(ticket_id: uuid.UUID, player_id: uuid.UUID) -> dict[str, Any]:
+    async with postgres_connection() as connection, connection.transaction():
+        ticket_row = await fetch_ticket_row(connection, ticket_id=ticket_id, player_id=player_id, for_update=True)
         if ticket_row is None:
             raise HTTPException(status_code=404, detail="Ticket not found.")
         if ticket_row["status"] == "matched":
             raise HTTPException(status_code=409, detail="Matched tickets cannot be cancelled.")
 
-        with connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
-            cursor.execute(
-                """
-                UPDATE tickets
-                SET status = 'cancelled', updated_at = NOW()
-                WHERE id = %s
-                RETURNING id, player_id, status, heartbeat_at, expires_at, match_id, created_at, updated_at
-                """,
-                (ticket_id,),
-            )
-            cancelled_row = cursor.fetchone()
-        return ticket_response_for_row(connection, cancelled_row)
+        cancelled_row = await connection.fetchrow(SQL_CANCEL_TICKET, ticket_id)
+        return await ticket_response_for_row(connection, dict(cancelled_row))
 
 
-def build_conflict_detail(
-    connection: psycopg.Connection,
+async def build_conflict_detail(
+    connection: asyncpg.Connection,
     match_id: uuid.UUID,
+    match_row: Mapping[str, Any],
     player_id: uuid.UUID,
     message: str,
+    latest_ply: int,
 ) -> dict[str, Any]:
-    return {
-        "message": message,
-        "current_state": current_match_state(connection, match_id, player_id),
-    }
+    moves = await fetch_match_moves(connection, match_id, match_row["game_id"])
+    if moves:
+        latest_ply = max(latest_ply, moves[-1]["ply"])
+    return jsonable_encoder(
+        {
+            "message": message,
+            "current_state": build_match_state(match_id, match_row, player_id, latest_ply, moves),
+        }
+    )
 
 
-def get_match_state_record(match_id: uuid.UUID, player_id: uuid.UUID | None = None) -> dict[str, Any]:
-    with connect_postgres() as connection, connection.transaction():
-        ensure_schema_ready(connection)
-        return current_match_state(connection, match_id, player_id)
+async def get_match_state_record(match_id: uuid.UUID, player_id: uuid.UUID | None = None) -> dict[str, Any]:
+    async with postgres_connection() as connection:
+        return await current_match_state(connection, match_id, player_id)
 
 
-def record_queue_match_move(
+async def record_queue_match_move(
     match_id: uuid.UUID,
     player_id: uuid.UUID,
     ply: int,
     move_uci: str,
 ) -> dict[str, Any]:
-    with connect_postgres() as connection, connection.transaction():
-        ensure_schema_ready(connection)
-        match_row = fetch_match_row(connection, match_id=match_id, for_update=True)
-        if match_row is None:
+    async with postgres_connection() as connection:
+        result = await connection.fetchrow(SQL_RECORD_MATCH_MOVE, match_id, ply, move_uci, player_id)
+        if result is None:
             raise HTTPException(status_code=404, detail="Match not found.")
-        if match_row["status"] != "active":
+        if result["inserted_ply"] is not None:
+            return {
+                "match_id": match_id,
+                "game_id": result["game_id"],
+                "ply": result["inserted_ply"],
+                "move_uci": result["inserted_move_uci"],
+                "player_id": player_id,
+                "created_at": result["inserted_created_at"],
+            }
+
+        if result["status"] != "active":
             raise HTTPException(status_code=409, detail="Match is not active.")
 
-        player_color = color_for_player(match_row, player_id)
+        player_color = color_for_player(result, player_id)
         if player_color is None:
             raise HTTPException(status_code=403, detail="Player is not part of this match.")
 
-        with connection.cursor() as cursor:
-            cursor.execute(
-                "SELECT COALESCE(MAX(ply), 0) FROM game_moves WHERE game_id = %s",
-                (match_row["game_id"],),
-            )
-            latest_ply = int(cursor.fetchone()[0])
-
+        latest_ply = result["latest_ply"]
         expected_ply = latest_ply + 1
         expected_turn = next_turn_for_ply(latest_ply)
-
         if player_color != expected_turn:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=build_conflict_detail(
-                    connection,
-                    match_id,
-                    player_id,
-                    f"It is {expected_turn}'s turn.",
-                ),
-            )
-
-        if ply != expected_ply:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=build_conflict_detail(
-                    connection,
-                    match_id,
-                    player_id,
-                    f"Expected ply {expected_ply}, received {ply}.",
-                ),
-            )
-
-        try:
-            with connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
-                cursor.execute(
-                    """
-                    INSERT INTO game_moves (game_id, ply, move_uci, player_id)
-                    VALUES (%s, %s, %s, %s)
-                    RETURNING %s::uuid AS match_id, game_id, ply, move_uci, player_id, created_at
-                    """,
-                    (match_row["game_id"], ply, move_uci, player_id, match_id),
-                )
-                move_row = cursor.fetchone()
-                cursor.execute(
-                    "UPDATE matches SET updated_at = NOW() WHERE id = %s",
-                    (match_id,),
-                )
-        except psycopg.errors.UniqueViolation:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=build_conflict_detail(
-                    connection,
-                    match_id,
-                    player_id,
-                    "This ply is already recorded on the server.",
-                ),
-            ) from None
+            message = f"It is {expected_turn}'s turn."
+        elif ply != expected_ply:
+            message = f"Expected ply {expected_ply}, received {ply}."
+        else:
+            message = "This ply is already recorded on the server."
 
-    return move_row
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=await build_conflict_detail(connection, match_id, result, player_id, message, latest_ply),
+        )
 
 
-def get_queue_match_moves(
+async def get_queue_match_moves(
     match_id: uuid.UUID,
     after_ply: int,
     player_id: uuid.UUID | None = None,
 ) -> dict[str, Any]:
-    with connect_postgres() as connection, connection.transaction():
-        ensure_schema_ready(connection)
-        match_state = current_match_state(connection, match_id, player_id)
-        filtered_moves = [move for move in match_state["moves"] if move["ply"] > after_ply]
+    async with postgres_connection() as connection:
+        match_state = await current_match_state(connection, match_id, player_id, after_ply=after_ply)
         return {
             "match_id": match_state["match_id"],
             "game_id": match_state["game_id"],
             "latest_ply": match_state["latest_ply"],
             "next_turn": match_state["next_turn"],
-            "moves": filtered_moves,
+            "moves": match_state["moves"],
         }
 
 
+class PostgresNotificationHub:
+    def __init__(self) -> None:
+        self._connection: asyncpg.Connection | None = None
+        self._subscribers: dict[str, set[asyncio.Queue[str | None]]] = {}
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self, channel: str) -> asyncio.Queue[str | None]:
+        async with self._lock:
+            if self._connection is None or self._connection.is_closed():
+                self._connection = await connect_postgres()
+                self._connection.add_termination_listener(self._on_terminated)
+
+            queue: asyncio.Queue[str | None] = asyncio.Queue()
+            subscribers = self._subscribers.get(channel)
+            if subscribers is None:
+                await self._connection.add_listener(channel, self._dispatch)
+                subscribers = self._subscribers[channel] = set()
+            subscribers.add(queue)
+            return queue
+
+    async def unsubscribe(self, channel: str, queue: asyncio.Queue[str | None]) -> None:
+        async with self._lock:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is None:
+                return
+            subscribers.discard(queue)
+            if subscribers:
+                return
+            del self._subscribers[channel]
+            if self._connection is not None and not self._connection.is_closed():
+                await self._connection.remove_listener(channel, self._dispatch)
+
+    async def close(self) -> None:
+        async with self._lock:
+            connection = self._connection
+            self._connection = None
+            self._disconnect_subscribers()
+            if connection is not None and not connection.is_closed():
+                await connection.close()
+
+    def _dispatch(self, connection: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        for queue in self._subscribers.get(channel, ()):
+            queue.put_nowait(payload)
+
+    def _on_terminated(self, connection: asyncpg.Connection) -> None:
+        if connection is not self._connection:
+            return
+        logger.warning("Postgres notification listener connection was lost")
+        self._connection = None
+        self._disconnect_subscribers()
+
+    def _disconnect_subscribers(self) -> None:
+        for subscribers in self._subscribers.values():
+            for queue in subscribers:
+                queue.put_nowait(None)
+        self._subscribers.clear()
+
+
+POSTGRES_NOTIFICATIONS = PostgresNotificationHub()
+
+
+async def drain_client_messages(websocket: WebSocket) -> None:
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+
+
+async def run_until_client_disconnects(websocket: WebSocket, pump: Awaitable[None]) -> None:
+    pump_task = asyncio.ensure_future(pump)
+    receive_task = asyncio.ensure_future(drain_client_messages(websocket))
+    try:
+        await asyncio.wait({pump_task, receive_task}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in (pump_task, receive_task):
+            task.cancel()
+        await asyncio.gather(pump_task, receive_task, return_exceptions=True)
+
+    if websocket.client_state != WebSocketState.CONNECTED:
+        return
+    close_code = status.WS_1000_NORMAL_CLOSURE
+    if not pump_task.cancelled() and pump_task.exception() is not None:
+        logger.error("Streaming to websocket client failed", exc_info=pump_task.exception())
+        close_code = status.WS_1011_INTERNAL_ERROR
+    await websocket.close(code=close_code)
+
+
+async def forward_match_notifications(websocket: WebSocket, queue: asyncio.Queue[str | None]) -> None:
+    while (message := await queue.get()) is not None:
+        await websocket.send_text(message)
+
+
+async def follow_matchmaking_ticket(
+    websocket: WebSocket,
+    queue: asyncio.Queue[str | None],
+    ticket_id: uuid.UUID,
+    player_id: uuid.UUID,
+) -> None:
+    while True:
+        try:
+            message = await asyncio.wait_for(queue.get(), timeout=TICKET_STREAM_HEARTBEAT_SECONDS)
+        except TimeoutError:
+            ticket = await heartbeat_matchmaking_ticket(ticket_id, player_id)
+            if ticket["status"] == "queued":
+                continue
+            await websocket.send_text(encode_stream_message("ticket", ticket))
+            return
+        if message is not None:
+            await websocket.send_text(message)
+        return
+
+
+@app.on_event("startup")
+async def startup_postgres() -> None:
+    app.state.dsn = None
+    app.state.pool = None
+    app.state.ticket_expiry_task = None
+    if has_postgres_configuration():
+        app.state.dsn = get_postgres_dsn()
+        app.state.pool = await create_postgres_pool(app.state.dsn)
+        await warm_postgres_pool(app.state.pool)
+    await ensure_postgres_startup_ready()
+    if app.state.pool is not None:
+        app.state.ticket_expiry_task = asyncio.create_task(expire_stale_tickets_periodically())
+
+
+@app.on_event("shutdown")
+async def shutdown_postgres() -> None:
+    ticket_expiry_task: asyncio.Task[None] | None = getattr(app.state, "ticket_expiry_task", None)
+    app.state.ticket_expiry_task = None
+    if ticket_expiry_task is not None:
+        ticket_expiry_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await ticket_expiry_task
+
+    await POSTGRES_NOTIFICATIONS.close()
+
+    pool: asyncpg.Pool | None = getattr(app.state, "pool", None)
+    app.state.pool = None
+    if pool is not None:
+        await pool.close()
+
+
 @app.on_event("startup")
 async def startup_gemini_live() -> None:
-    ensure_postgres_startup_ready()
     GEMINI_LIVE_CLIENT.ensure_connection_background()
     GEMINI_PASSIVE_COMMENTARY_CLIENT.ensure_connection_background()
     Thread(
@@ -3517,17 +3937,14 @@ async def shutdown_gemini_live() -> None:
 
 
 @app.get("/health/ping")
-def health_ping() -> dict[str, Any]:
-    postgres_ok, postgres_message = ping_postgres()
-    status_code = 200 if postgres_ok else 503
-    payload = {
-        "ok": postgres_ok,
-        "messages": [
-            "Server ping successful",
-            postgres_message,
-        ],
-    }
-    return JSONResponse(content=payload, status_code=status_code)
+async def health_ping() -> Response:
+    postgres_ok, postgres_message = await cached_ping_postgres()
+    if postgres_ok:
+        return Response(content=HEALTH_PING_OK_BODY, media_type="application/json")
+    return trusted_json_response(
+        {"ok": False, "messages": ["Server ping successful", postgres_message]},
+        status_code=503,
+    )
 
 
 @app.on_event("shutdown")
@@ -3930,10 +4347,10 @@ async def create_gemini_commentary(payload: GeminiCoachRequest) -> dict[str, Any
     return commentary.model_dump()
 
 
-@app.post("/v1/games")
-def create_game() -> dict[str, str]:
+@app.post("/v1/games", response_model=CreateGameResponse)
+async def create_game() -> dict[str, str]:
     try:
-        game_id = create_game_record()
+        game_id = await create_game_record()
         return {"game_id": str(game_id)}
     except Exception as exc:  # pragma: no cover - exercised in integration
         logger.exception("Could not create game log in Postgres")
@@ -3944,9 +4361,9 @@ def create_game() -> dict[str, str]:
 
 
 @app.post("/v1/games/{game_id}/moves", response_model=GameMoveRecord)
-def record_game_move(game_id: uuid.UUID, payload: GameMoveRequest) -> dict[str, Any]:
+async def record_game_move(game_id: uuid.UUID, payload: GameMoveRequest) -> dict[str, Any]:
     try:
-        return save_game_move(game_id, payload.ply, payload.move_uci)
+        return await save_game_move(game_id, payload.ply, payload.move_uci)
     except HTTPException:
         raise
     except Exception as exc:  # pragma: no cover - exercised in integration
@@ -3957,70 +4374,150 @@ def record_game_move(game_id: uuid.UUID, payload: GameMoveRequest) -> dict[str,
         ) from exc
 
 
-@app.get("/v1/games/{game_id}/moves")
-def get_game_moves(game_id: uuid.UUID) -> dict[str, Any]:
+@app.post("/v1/games/{game_id}/moves:batch", response_model=GameMovesResponse)
+async def record_game_moves_batch(game_id: uuid.UUID, payload: GameMovesBatchRequest) -> dict[str, Any]:
     try:
-        return {"game_id": str(game_id), "moves": fetch_game_moves(game_id)}
+        return {"game_id": game_id, "moves": await save_game_moves(game_id, payload.moves)}
+    except HTTPException:
+        raise
+    except Exception as exc:  # pragma: no cover - exercised in integration
+        logger.exception("Could not record game moves in Postgres")
+        raise HTTPException(
+            status_code=503,
+            detail=f"Could not record game moves in Postgres: {exc}",
+        ) from exc
+
+
+@app.get("/v1/games/{game_id}/moves", response_model=GameMovesResponse)
+async def get_game_moves(game_id: uuid.UUID) -> Response:
+    try:
+        moves_json = await fetch_game_moves(game_id)
     except Exception as exc:  # pragma: no cover - exercised in integration
         logger.exception("Could not load game moves from Postgres")
         raise HTTPException(
             status_code=503,
             detail=f"Could not load game moves from Postgres: {exc}",
         ) from exc
+    return trusted_json_response({"game_id": game_id, "moves": orjson.Fragment(moves_json)})
 
 
 @app.post("/v1/matchmaking/enqueue", response_model=TicketResponse)
-def enqueue_matchmaking(payload: EnqueueMatchmakingRequest) -> dict[str, Any]:
-    return enqueue_player_for_matchmaking(payload.player_id)
+async def enqueue_matchmaking(payload: EnqueueMatchmakingRequest) -> dict[str, Any]:
+    return await enqueue_player_for_matchmaking(payload.player_id)
 
 
 @app.post("/v1/matchmaking/{ticket_id}/heartbeat", response_model=TicketResponse)
-def heartbeat_matchmaking(
+async def heartbeat_matchmaking(
     ticket_id: uuid.UUID,
     payload: MatchmakingTicketActionRequest,
 ) -> dict[str, Any]:
-    return heartbeat_matchmaking_ticket(ticket_id, payload.player_id)
+    return await heartbeat_matchmaking_ticket(ticket_id, payload.player_id)
 
 
 @app.get("/v1/matchmaking/{ticket_id}", response_model=TicketResponse)
-def get_matchmaking_status(
+async def get_matchmaking_status(
     ticket_id: uuid.UUID,
     player_id: uuid.UUID | None = Query(default=None),
+    wait_ms: int = Query(default=0, ge=0, le=TICKET_LONG_POLL_MAX_MS),
 ) -> dict[str, Any]:
-    return get_matchmaking_ticket(ticket_id, player_id)
+    if wait_ms:
+        return await wait_for_matchmaking_ticket(ticket_id, player_id, wait_ms / 1000)
+    return await get_matchmaking_ticket(ticket_id, player_id)
 
 
 @app.delete("/v1/matchmaking/{ticket_id}", response_model=TicketResponse)
-def delete_matchmaking_ticket(
+async def delete_matchmaking_ticket(
     ticket_id: uuid.UUID,
     player_id: uuid.UUID = Query(...),
 ) -> dict[str, Any]:
-    return cancel_matchmaking_ticket(ticket_id, player_id)
+    return await cancel_matchmaking_ticket(ticket_id, player_id)
 
 
 @app.get("/v1/matches/{match_id}/state", response_model=MatchStateResponse)
-def get_match_state(
+async def get_match_state(
     match_id: uuid.UUID,
     player_id: uuid.UUID | None = Query(default=None),
-) -> dict[str, Any]:
-    return get_match_state_record(match_id, player_id)
+) -> Response:
+    return trusted_json_response(await get_match_state_record(match_id, player_id))
 
 
 @app.post("/v1/matches/{match_id}/moves", response_model=MatchMoveRecord)
-def post_match_move(
+async def post_match_move(
     match_id: uuid.UUID,
     payload: QueueMatchMoveRequest,
 ) -> dict[str, Any]:
-    return record_queue_match_move(match_id, payload.player_id, payload.ply, payload.move_uci)
+    return await record_queue_match_move(match_id, payload.player_id, payload.ply, payload.move_uci)
 
 
 @app.get("/v1/matches/{match_id}/moves", response_model=MatchMovesResponse)
-def get_match_moves(
+async def get_match_moves(
     match_id: uuid.UUID,
     after_ply: int = Query(default=0, ge=0),
     player_id: uuid.UUID | None = Query(default=None),
-) -> dict[str, Any]:
-    return get_queue_match_moves(match_id, after_ply, player_id)
+) -> Response:
+    return trusted_json_response(await get_queue_match_moves(match_id, after_ply, player_id))
+
+
+@app.websocket("/v1/matches/{match_id}/stream")
+async def match_stream_socket(
+    websocket: WebSocket,
+    match_id: uuid.UUID,
+    after_ply: int = Query(default=0, ge=0),
+    player_id: uuid.UUID | None = Query(default=None),
+) -> None:
+    await websocket.accept()
+    channel = match_notification_channel(match_id)
+    try:
+        queue = await POSTGRES_NOTIFICATIONS.subscribe(channel)
+    except Exception:
+        logger.exception("Could not subscribe to match notifications")
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+        return
+
+    try:
+        # Subscribe before the snapshot so no move falls between the two.
+        try:
+            snapshot = await get_queue_match_moves(match_id, after_ply, player_id)
+        except HTTPException as exc:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(exc.detail))
+            return
+        await websocket.send_text(encode_stream_message("moves", snapshot))
+        await run_until_client_disconnects(websocket, forward_match_notifications(websocket, queue))
+    finally:
+        await POSTGRES_NOTIFICATIONS.unsubscribe(channel, queue)
+
+
+@app.websocket("/v1/matchmaking/{ticket_id}/stream")
+async def matchmaking_stream_socket(
+    websocket: WebSocket,
+    ticket_id: uuid.UUID,
+    player_id: uuid.UUID = Query(...),
+) -> None:
+    await websocket.accept()
+    channel = ticket_notification_channel(ticket_id)
+    try:
+        queue = await POSTGRES_NOTIFICATIONS.subscribe(channel)
+    except Exception:
+        logger.exception("Could not subscribe to matchmaking notifications")
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+        return
+
+    try:
+        try:
+            ticket = await heartbeat_matchmaking_ticket(ticket_id, player_id)
+        except HTTPException as exc:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(exc.detail))
+            return
+        await websocket.send_text(encode_stream_message("ticket", ticket))
+        if ticket["status"] != "queued":
+            await websocket.close()
+            return
+        await run_until_client_disconnects(
+            websocket,
+            follow_matchmaking_ticket(websocket, queue, ticket_id, player_id),
+        )
+    finally:
+        await POSTGRES_NOTIFICATIONS.unsubscribe(channel, queue)
 
 
 if __name__ == "__main__":
@@ -4035,12 +4532,16 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     if args.ensure_schema:
-        ensure_postgres_startup_ready(require_configuration=True)
+        asyncio.run(ensure_postgres_startup_ready(require_configuration=True))
         raise SystemExit(0)
 
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=int(os.getenv("PORT", "8080")),
+        loop="auto",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        log_level="info",
         reload=False,
     )
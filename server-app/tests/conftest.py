@@ -0,0 +1,28 @@
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    # Not entered as a context manager, so startup hooks (Postgres pool, Gemini) don't run.
+    from main import app
+
+    return TestClient(app)
+
+
+def clear_environment_caches() -> None:
+    main = sys.modules.get("main")
+    if main is None:
+        return
+    main.get_postgres_dsn.cache_clear()
+    main.is_placeholder_value.cache_clear()
+    main.redact_postgres_host.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def fresh_environment_caches():
+    clear_environment_caches()
+    yield
+    clear_environment_caches()